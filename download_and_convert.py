@@ -18,116 +18,217 @@ import json
 import re
 import unicodedata
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
+from functools import lru_cache
+import hashlib
 import html
+import io
 from typing import Dict, List, Any
 import os
 import argparse
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+try:
+    import ijson
+except ImportError:
+    ijson = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from config import API_BASE_URL, API_KEY, DEFAULT_BATCH_SIZE, DEFAULT_NUM_BATCHES, DEFAULT_OUTPUT_DIR, DEFAULT_INPUT_FILE
 
-def download_raw_data(output_file="raw.json", limit=5, offset=0):
+# Errors raised for malformed JSON by json/orjson and, when installed, ijson
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson is not None else (json.JSONDecodeError,)
+
+# API rate limit: 1 request per second, with a short burst of 2 requests
+API_REQUESTS_PER_SECOND = 1
+MAX_CONCURRENT_REQUESTS = 2
+
+# Concurrent image downloads per article through the Lambda proxy
+MAX_IMAGE_DOWNLOADS = 8
+
+# Article files written concurrently while the main loop moves on
+MAX_FILE_WRITERS = 4
+
+# Articles rendered ahead of the main loop, so one article's image downloads
+# overlap with the next; together with the image downloads this stays within
+# the session's connection pool
+MAX_ARTICLE_WORKERS = 2
+
+# Article index in the output directory: per article ID, the file it was written
+# to, source and rendered-content hashes and the local images it references, so
+# existing articles can be found and compared without re-rendering or
+# re-reading their files
+INDEX_FILENAME = ".index.json"
+
+# Bump when the Markdown output format changes so cached articles are re-rendered
+RENDER_VERSION = 1
+
+S3_IMAGE_HOST = "geolytics-hub-images.s3.eu-central-1.amazonaws.com"
+
+# Precompiled patterns used per article
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_DASH_RE = re.compile(r"[-\s]+")
+# ASCII characters _SLUG_STRIP_RE removes, for str.translate
+_SLUG_ASCII_DROP = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(128)) if not (c.isalnum() or c.isspace() or c in '_-')
+))
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_PLAIN_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# S3 image URLs in rendered markdown or raw text, including <img src="...">
+# since the URL stops at the quote
+# group(1) is the full URL; group(2) is the tail after domain (key + optional query)
+_S3_URL_RE = re.compile(
+    r'(https?://geolytics-hub-images\.s3\.eu-central-1\.amazonaws\.com/([^\s\)\]"\'<>]+))',
+    re.IGNORECASE
+)
+# Markdown links pointing to local image files, but not already-image syntax
+# (negative lookbehind for '!'), e.g. [alt](./images/foo.png) => ![](./images/foo.png)
+_LINK_TO_IMG_RE = re.compile(
+    r"(?<!!)\[[^\]]*\]\(((?:\.\.?\/?images\/)[^)]+\.(?:png|jpg|jpeg|gif|webp|svg))\)",
+    re.IGNORECASE,
+)
+# Month subdirectories written with --shard-by-month (see article_subdir)
+_MONTH_DIR_RE = re.compile(r"\d{4}-\d{2}|unknown")
+# Local image references in rendered Markdown (./images/... or ../images/...);
+# group 1 is the path relative to the output directory
+_LOCAL_IMAGE_RE = re.compile(r"""(?<![\w./])\.\.?/(images/[^\s)\]"'<>]+)""")
+
+# Shared session so API batches and image downloads reuse keep-alive
+# connections instead of paying a TCP+TLS handshake per request. The API key
+# is sent per API request so it never reaches the image proxy.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+))
+
+def json_loads(data):
+    """
+    Parse JSON text or bytes, using orjson when available
     """
-    Download raw data from Siemens API
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj, indent=False):
+    """
+    Serialize a value to a JSON string, using orjson when available
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None)
+
+def json_dumps_bytes(obj, indent=False):
+    """
+    Serialize a value to UTF-8 JSON bytes, ready for binary-mode writes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+def write_bytes_atomic(path, data: bytes):
+    """
+    Write a file with a single write to a temp file, then rename it into place
+    so readers never see a partially written file
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def fetch_batch(limit=5, offset=0):
+    """
+    Fetch a single batch of articles from the API
+    Returns (articles, meta); raises on request or parse errors
     """
     url = f"{API_BASE_URL}/v1/topics/export?limit={limit}&offset={offset}"
-    headers = {"x-api-key": API_KEY}
     
-    try:
-        print(f"Downloading data from API...")
-        print(f"URL: {url}")
-        
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        # Parse response to check actual article count
-        try:
-            response_data = response.json()
-            # Check if data is nested in 'body' field
-            if 'body' in response_data and isinstance(response_data['body'], str):
-                body_data = json.loads(response_data['body'])
-                actual_articles = body_data.get('topics', [])
-                meta_info = body_data.get('meta', {})
-                api_limit = meta_info.get('limit', 'unknown')
-                print(f"API returned {len(actual_articles)} articles (requested: {limit}, API limit: {api_limit})")
-            else:
-                actual_articles = response_data.get('topics', [])
-                print(f"API returned {len(actual_articles)} articles (requested: {limit})")
-            
-            if len(actual_articles) != limit:
-                print(f"⚠️  Note: API returned different number of articles than requested. This might be due to:")
-                print(f"   - API returning all available articles if less than requested")
-                print(f"   - API having a different default behavior")
-                print(f"   - API pagination or caching behavior")
-        except Exception as e:
-            print(f"Could not parse response to count articles: {e}")
-        
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(response.text)
-        
-        print(f"✅ Successfully downloaded data to {output_file}")
-        return True
-        
-    except requests.exceptions.RequestException as e:
-        print(f"❌ Error downloading data: {e}")
-        return False
-    except Exception as e:
-        print(f"❌ Unexpected error: {e}")
-        return False
+    response = _SESSION.get(url, headers={"x-api-key": API_KEY}, timeout=30)
+    response.raise_for_status()
+    
+    response_data = json_loads(response.content)
+    
+    # Check if data is nested in 'body' field
+    if 'body' in response_data and isinstance(response_data['body'], str):
+        body_data = json_loads(response_data['body'])
+        return body_data.get('topics', []), body_data.get('meta', {})
+    return response_data.get('topics', []), response_data.get('meta', {})
 
 def download_multiple_batches(output_file="raw.json", batch_size=5, num_batches=2):
     """
-    Download data from multiple API batches and combine them
+    Download data from multiple API batches within the API rate limit and combine them
     """
     all_articles = []
     all_meta = {}
     
     print(f"🔄 Downloading {num_batches} batches of {batch_size} articles each...")
     
-    for batch in range(num_batches):
+    def fetch(batch):
         offset = batch * batch_size
-        print(f"\n--- Batch {batch + 1}/{num_batches} (offset: {offset}) ---")
-        
-        url = f"{API_BASE_URL}/v1/topics/export?limit={batch_size}&offset={offset}"
-        headers = {"x-api-key": API_KEY}
-        
         try:
-            response = requests.get(url, headers=headers)
-            response.raise_for_status()
-            
-            response_data = response.json()
-            
-            # Check if data is nested in 'body' field
-            if 'body' in response_data and isinstance(response_data['body'], str):
-                body_data = json.loads(response_data['body'])
-                articles = body_data.get('topics', [])
-                meta = body_data.get('meta', {})
-            else:
-                articles = response_data.get('topics', [])
-                meta = response_data.get('meta', {})
-            
-            print(f"Batch {batch + 1}: Got {len(articles)} articles")
-            all_articles.extend(articles)
-            
-            # Update meta info (use the latest batch's meta)
-            all_meta.update(meta)
-            
-            # If we got fewer articles than requested, we've reached the end
-            if len(articles) < batch_size:
-                print(f"⚠️  Batch {batch + 1} returned fewer articles than requested. This might be the last batch.")
-                break
-                
+            return fetch_batch(batch_size, offset)
         except requests.exceptions.RequestException as e:
             print(f"❌ Error downloading batch {batch + 1}: {e}")
-            continue
         except Exception as e:
             print(f"❌ Unexpected error in batch {batch + 1}: {e}")
-            continue
+        return None
+    
+    # The first batches use the API burst allowance and are fetched concurrently;
+    # later batches are requested one at a time, each window starting only once
+    # the rate limit allows (see README, Rate Limits & Quotas). A short batch ends
+    # the download before the next request, so at most the first window can
+    # spend quota past the end of the data
+    reached_end = False
+    next_batch = 0
+    window_size = MAX_CONCURRENT_REQUESTS
+    window_started = None
+    with ThreadPoolExecutor(max_workers=max(1, min(num_batches, MAX_CONCURRENT_REQUESTS))) as pool:
+        while next_batch < num_batches:
+            window = range(next_batch, min(next_batch + window_size, num_batches))
+            if window_started is not None:
+                time.sleep(max(0.0, window_started + previous_size / API_REQUESTS_PER_SECOND - time.monotonic()))
+            window_started = time.monotonic()
+            previous_size = len(window)
+            next_batch = window.stop
+            window_size = 1
+            results = list(pool.map(fetch, window))
+            
+            # Combine in offset order so the output matches a sequential download
+            for batch, result in zip(window, results):
+                offset = batch * batch_size
+                print(f"\n--- Batch {batch + 1}/{num_batches} (offset: {offset}) ---")
+                if result is None:
+                    continue
+                articles, meta = result
+                
+                print(f"Batch {batch + 1}: Got {len(articles)} articles")
+                all_articles.extend(articles)
+                
+                # Update meta info (use the latest batch's meta)
+                all_meta.update(meta)
+                
+                # If we got fewer articles than requested, we've reached the end
+                if len(articles) < batch_size:
+                    print(f"⚠️  Batch {batch + 1} returned fewer articles than requested. This might be the last batch.")
+                    reached_end = True
+                    break
+            
+            if reached_end:
+                break
     
     # Combine all articles into a single response
     combined_response = {
         "statusCode": 200,
         "headers": {"Content-Type": "application/json; charset=utf-8"},
-        "body": json.dumps({
+        "body": json_dumps({
             "meta": {
                 **all_meta,
                 "limit": len(all_articles),
@@ -139,23 +240,31 @@ def download_multiple_batches(output_file="raw.json", batch_size=5, num_batches=
     }
     
     # Save combined data
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(combined_response, f, indent=2)
+    write_bytes_atomic(output_file, json_dumps_bytes(combined_response, indent=True))
     
     print(f"\n✅ Successfully downloaded {len(all_articles)} total articles to {output_file}")
     return len(all_articles) > 0
 
+@lru_cache(maxsize=4096)
 def slugify(value, allow_unicode=True):
     """
     Convert text to URL-friendly slug format
+    Cached because titles are slugified more than once per run
     """
     value = str(value)
-    if allow_unicode:
-        value = unicodedata.normalize("NFKC", value)
-    else:
-        value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
-    value = re.sub(r"[^\w\s-]", "", value.lower())
-    return re.sub(r"[-\s]+", "-", value).strip("-_")
+    # Normalization is a no-op for ASCII, which most titles are
+    if not value.isascii():
+        if allow_unicode:
+            value = unicodedata.normalize("NFKC", value)
+        else:
+            value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    if value.isascii():
+        # Same result as the regex path below, without the regex engine:
+        # drop everything but \w, \s and '-', then collapse [-\s]+ runs to '-'
+        value = value.lower().translate(_SLUG_ASCII_DROP)
+        return '-'.join(value.replace('-', ' ').split()).strip("-_")
+    value = _SLUG_STRIP_RE.sub("", value.lower())
+    return _SLUG_DASH_RE.sub("-", value).strip("-_")
 
 def to_yaml_like(value):
     """
@@ -185,14 +294,12 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
     
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Remove newlines and tabs
-    text = text.replace('\n', ' ').replace('\t', ' ')
+    # Collapse whitespace runs (incl. newlines and tabs) and trim in one pass;
+    # str.split() uses the same whitespace definition as \s
+    text = ' '.join(text.split())
     # Remove HTML tags (if any)
-    text = re.sub(r'<[^>]+>', '', text)
-    # Clean leading and trailing whitespace
-    text = text.strip()
+    if '<' in text:
+        text = _HTML_TAG_RE.sub('', text).strip()
     
     return text
 
@@ -206,8 +313,8 @@ def parse_content(content_data: Any) -> str:
     # If content is a string, try to parse as JSON
     if isinstance(content_data, str):
         try:
-            content_data = json.loads(content_data)
-        except:
+            content_data = json_loads(content_data)
+        except ValueError:
             return clean_text(content_data)
     
     # If content is a dict, extract and convert to Markdown
@@ -237,36 +344,14 @@ def convert_node_to_markdown(node: dict) -> str:
     """
     Convert a single node to Markdown format
     """
-    node_type = node.get('type', '')
-    
-    if node_type == 'paragraph':
-        return convert_paragraph_to_markdown(node)
-    elif node_type == 'heading':
-        return convert_heading_to_markdown(node)
-    elif node_type == 'bulletList':
-        return convert_bullet_list_to_markdown(node)
-    elif node_type == 'orderedList':
-        return convert_ordered_list_to_markdown(node)
-    elif node_type == 'listItem':
-        return convert_list_item_to_markdown(node)
-    elif node_type == 'blockquote':
-        return convert_blockquote_to_markdown(node)
-    elif node_type == 'codeBlock':
-        return convert_code_block_to_markdown(node)
-    elif node_type == 'table':
-        return convert_table_to_markdown(node)
-    elif node_type == 'image':
-        return convert_image_to_markdown(node)
-    elif node_type == 'imageResize':
-        # Treat imageResize the same as image
-        return convert_image_to_markdown(node)
-    elif node_type == 'horizontalRule':
-        return '---'
-    else:
-        # For other types, try recursive processing
-        if 'content' in node:
-            return convert_to_markdown(node)
-        return ""
+    converter = _NODE_CONVERTERS.get(node.get('type', ''))
+    if converter is not None:
+        return converter(node)
+    
+    # For other types, try recursive processing
+    if 'content' in node:
+        return convert_to_markdown(node)
+    return ""
 
 def convert_paragraph_to_markdown(node: dict) -> str:
     """
@@ -291,25 +376,42 @@ def convert_text_node_to_markdown(node: dict) -> str:
     
     text = node.get('text', '')
     marks = node.get('marks', [])
-    
-    # Apply all marks
-    for mark in marks:
-        if isinstance(mark, dict):
-            mark_type = mark.get('type', '')
-            if mark_type == 'bold':
-                text = f"**{text}**"
-            elif mark_type == 'italic':
-                text = f"*{text}*"
-            elif mark_type == 'code':
-                text = f"`{text}`"
-            elif mark_type == 'link':
-                attrs = mark.get('attrs', {})
-                href = attrs.get('href', '#')
-                text = f"[{text}]({href})"
-            elif mark_type == 'strike':
-                text = f"~~{text}~~"
-    
-    return text
+    if not marks:
+        return text
+    
+    # Reduce marks to hashable (type, href) pairs so repeated inline text
+    # (footers, "Read more" links, ...) hits the cache
+    marks_key = tuple(
+        (mark.get('type', ''), mark.get('attrs', {}).get('href', '#') if mark.get('type') == 'link' else None)
+        for mark in marks if isinstance(mark, dict)
+    )
+    return apply_text_marks(text, marks_key)
+
+@lru_cache(maxsize=4096)
+def apply_text_marks(text: str, marks_key: tuple) -> str:
+    """
+    Wrap text in Markdown for (mark type, link href) pairs; the first mark is the innermost
+    """
+    prefix = []
+    suffix = []
+    for mark_type, href in marks_key:
+        if mark_type == 'bold':
+            prefix.append("**")
+            suffix.append("**")
+        elif mark_type == 'italic':
+            prefix.append("*")
+            suffix.append("*")
+        elif mark_type == 'code':
+            prefix.append("`")
+            suffix.append("`")
+        elif mark_type == 'link':
+            prefix.append("[")
+            suffix.append(f"]({href})")
+        elif mark_type == 'strike':
+            prefix.append("~~")
+            suffix.append("~~")
+    
+    return ''.join(reversed(prefix)) + text + ''.join(suffix)
 
 def convert_heading_to_markdown(node: dict) -> str:
     """
@@ -420,6 +522,7 @@ def convert_table_to_markdown(node: dict) -> str:
         return ""
     
     table_rows = []
+    col_count = 0
     for row in node['content']:
         if isinstance(row, dict) and row.get('type') == 'tableRow':
             row_cells = []
@@ -429,18 +532,17 @@ def convert_table_to_markdown(node: dict) -> str:
                     cell_text = convert_table_cell_to_markdown(cell)
                     row_cells.append(cell_text)
             if row_cells:
+                if not table_rows:
+                    # Header row determines the number of columns
+                    col_count = len(row_cells)
                 table_rows.append('| ' + ' | '.join(row_cells) + ' |')
     
     if not table_rows:
         return ""
     
     # Add table header separator line
-    if len(table_rows) > 0:
-        # Calculate number of columns
-        first_row = table_rows[0]
-        col_count = len([col for col in first_row.split('|') if col.strip()])
-        separator = '| ' + ' | '.join(['---'] * col_count) + ' |'
-        table_rows.insert(1, separator)
+    separator = '| ' + ' | '.join(['---'] * col_count) + ' |'
+    table_rows.insert(1, separator)
     
     return '\n'.join(table_rows)
 
@@ -474,8 +576,8 @@ def extract_s3_image_urls(content_obj: Any) -> List[tuple]:
     # If content_obj is a JSON string, try to parse to dict first
     if isinstance(content_obj, str):
         try:
-            content_obj = json.loads(content_obj)
-        except Exception:
+            content_obj = json_loads(content_obj)
+        except ValueError:
             # Not JSON; no structured scan possible
             return []
     
@@ -515,19 +617,19 @@ def download_s3_image_via_lambda(key: str) -> bytes:
     lambda_url = "https://segwspb2rqyl3weo5ykk4ngqde0ouypq.lambda-url.eu-central-1.on.aws/images/proxy"
     
     try:
-        response = requests.get(lambda_url, params={"key": key}, timeout=30)
-        
-        if response.status_code == 200:
-            content_type = response.headers.get('content-type', '')
-            if 'image' in content_type.lower():
-                return response.content
+        # Stream so the body is only read once status and content type check out
+        with _SESSION.get(lambda_url, params={"key": key}, timeout=30, stream=True) as response:
+            if response.status_code == 200:
+                content_type = response.headers.get('content-type', '')
+                if 'image' in content_type.lower():
+                    return response.content
+                else:
+                    print(f"Warning: Lambda returned non-image content for key {key}")
+                    return None
             else:
-                print(f"Warning: Lambda returned non-image content for key {key}")
+                print(f"Warning: Lambda returned status {response.status_code} for key {key}")
                 return None
-        else:
-            print(f"Warning: Lambda returned status {response.status_code} for key {key}")
-            return None
-            
+        
     except requests.exceptions.RequestException as e:
         print(f"Warning: Failed to download image for key {key}: {e}")
         return None
@@ -535,24 +637,35 @@ def download_s3_image_via_lambda(key: str) -> bytes:
         print(f"Warning: Unexpected error downloading image for key {key}: {e}")
         return None
 
+# Directories already created by ensure_dir during this run
+_CREATED_DIRS = set()
+
+def ensure_dir(path: str):
+    """
+    Create a directory (and parents) once per run, skipping the makedirs
+    syscalls for directories already created
+    """
+    if path not in _CREATED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
 def save_image_locally(image_data: bytes, key: str, out_dir: str) -> str:
     """
     Save downloaded image locally with proper directory structure
     Returns local path for markdown reference
     """
-    # Create images directory
     images_dir = os.path.join(out_dir, "images")
-    os.makedirs(images_dir, exist_ok=True)
     
     # Create subdirectory structure from key
     key_parts = key.split('/')
     if len(key_parts) > 1:
         # Create subdirectories
         subdir = os.path.join(images_dir, *key_parts[:-1])
-        os.makedirs(subdir, exist_ok=True)
+        ensure_dir(subdir)
         local_path = os.path.join(subdir, key_parts[-1])
     else:
         # Just filename, save directly in images directory
+        ensure_dir(images_dir)
         local_path = os.path.join(images_dir, key)
     
     # Save image
@@ -562,10 +675,27 @@ def save_image_locally(image_data: bytes, key: str, out_dir: str) -> str:
     # Return relative path for markdown
     return os.path.relpath(local_path, out_dir).replace('\\', '/')
 
-def compute_local_image_paths(key: str, out_dir: str) -> (str, str):
+# Image key -> future of its download, shared by render workers so each missing
+# image is fetched and saved once per run
+_IMAGE_DOWNLOADS = {}
+_IMAGE_DOWNLOADS_LOCK = threading.Lock()
+
+def download_and_save_image(key: str, out_dir: str) -> bool:
+    """
+    Download an S3 image via the Lambda proxy and save it under out_dir
+    Returns whether the image was saved
+    """
+    image_data = download_s3_image_via_lambda(key)
+    if not image_data:
+        return False
+    save_image_locally(image_data, key, out_dir)
+    return True
+
+def compute_local_image_paths(key: str, out_dir: str, md_dir: str = None) -> (str, str):
     """
     Compute absolute and relative local paths for an image key without writing the file.
-    Returns (abs_path, rel_path_from_out_dir_with_unix_separators_and_dot_prefix)
+    Returns (abs_path, rel_path_from_md_dir_with_unix_separators_and_dot_prefix);
+    md_dir defaults to out_dir
     """
     images_dir = os.path.join(out_dir, "images")
     key_parts = key.split('/')
@@ -574,8 +704,8 @@ def compute_local_image_paths(key: str, out_dir: str) -> (str, str):
         abs_path = os.path.join(subdir, key_parts[-1])
     else:
         abs_path = os.path.join(images_dir, key)
-    rel_path = os.path.relpath(abs_path, out_dir).replace('\\', '/')
-    if not rel_path.startswith(('./', '/')):
+    rel_path = os.path.relpath(abs_path, md_dir or out_dir).replace('\\', '/')
+    if not rel_path.startswith(('./', '../', '/')):
         rel_path = f"./{rel_path}"
     return abs_path, rel_path
 
@@ -588,47 +718,71 @@ def convert_image_to_markdown(node: dict) -> str:
     # Intentionally omit alt/title to avoid polluting markdown output
     return f"![]({src})"
 
-def format_date(date_str: str) -> str:
+# Node type -> converter, used by convert_node_to_markdown
+_NODE_CONVERTERS = {
+    'paragraph': convert_paragraph_to_markdown,
+    'heading': convert_heading_to_markdown,
+    'bulletList': convert_bullet_list_to_markdown,
+    'orderedList': convert_ordered_list_to_markdown,
+    'listItem': convert_list_item_to_markdown,
+    'blockquote': convert_blockquote_to_markdown,
+    'codeBlock': convert_code_block_to_markdown,
+    'table': convert_table_to_markdown,
+    'image': convert_image_to_markdown,
+    # Treat imageResize the same as image
+    'imageResize': convert_image_to_markdown,
+    'horizontalRule': lambda node: '---',
+}
+
+@lru_cache(maxsize=2048)
+def parse_date(date_str: str):
     """
-    Format date string - only show date part, remove time details
+    Parse an API date string to YYYY-MM-DD, or None if empty or unparseable
+    Cached since many articles share the same edit dates
     """
     if not date_str:
-        return "Unknown date"
+        return None
     
     try:
         # Try to parse ISO format with time (e.g., "2025-09-19T00:00:00.000Z")
         if 'T' in date_str:
             date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return date_obj.strftime("%Y-%m-%d")
         else:
             # Try to parse simple date format
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            return date_obj.strftime("%Y-%m-%d")
-    except:
+        return date_obj.strftime("%Y-%m-%d")
+    except (ValueError, TypeError):
+        return None
+
+def format_date(date_str: str) -> str:
+    """
+    Format date string - only show date part, remove time details
+    """
+    if not date_str:
+        return "Unknown date"
+    
+    # Non-string values can't be parsed (or used as cache keys); show them as-is
+    if not isinstance(date_str, str):
+        return date_str
+    
+    # Already in the output format (strptime would round-trip or fail to it)
+    if _PLAIN_DATE_RE.fullmatch(date_str):
         return date_str
+    
+    return parse_date(date_str) or date_str
 
 def format_date_for_filename(date_str: str) -> str:
     """
     Format date string for use in filename (YYYY-MM-DD format)
     """
-    if not date_str:
-        return "unknown-date"
-    
-    try:
-        # Try to parse ISO format with time (e.g., "2025-09-19T00:00:00.000Z")
-        if 'T' in date_str:
-            date_obj = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            return date_obj.strftime("%Y-%m-%d")
-        else:
-            # Try to parse simple date format
-            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
-            return date_obj.strftime("%Y-%m-%d")
-    except:
+    if not isinstance(date_str, str):
         return "unknown-date"
+    return parse_date(date_str) or "unknown-date"
 
-def format_authors(authors: List[str]) -> str:
+@lru_cache(maxsize=2048)
+def format_authors(authors: tuple) -> str:
     """
-    Format author list
+    Format author list (pass a tuple so results can be cached)
     """
     if not authors:
         return "Unknown author"
@@ -647,7 +801,7 @@ def format_tags(tags: List[str]) -> str:
     if not tags:
         return ""
     
-    return " | ".join([f"`{tag}`" for tag in tags])
+    return " | ".join(map("`{}`".format, tags))
 
 def format_countries(countries: List[str]) -> str:
     """
@@ -656,25 +810,44 @@ def format_countries(countries: List[str]) -> str:
     if not countries:
         return ""
     
-    return " | ".join([f"**{country.upper()}**" for country in countries])
+    return " | ".join(map("**{}**".format, map(str.upper, countries)))
 
-def load_payload(path):
+def iter_articles(path):
     """
-    Load JSON data, compatible with raw.json format
+    Yield articles from a raw.json payload one at a time
+    With ijson installed the topics array is parsed incrementally, so only one
+    article is materialized at a time instead of the whole list; a malformed
+    body raises one of JSON_ERRORS either way
     """
     with open(path, "r", encoding="utf-8") as f:
-        top = json.load(f)
+        top = json_loads(f.read())
     # Compatible with raw.json (body is JSON string) case
     if isinstance(top.get("body"), str):
-        try:
-            return json.loads(top["body"])
-        except json.JSONDecodeError:
-            pass
-    return top
+        if ijson is None:
+            yield from json_loads(top["body"]).get('topics', [])
+            return
+        body = io.BytesIO(top.pop("body").encode("utf-8"))
+        del top
+        yield from ijson.items(body, "topics.item", use_float=True)
+        return
+    yield from top.get('topics', [])
+
+def stop_at_parse_error(articles, errors):
+    """
+    Yield articles until the payload turns out to be malformed; the parse error
+    is appended to errors instead of raised, so articles parsed before it can
+    still be indexed and logged
+    """
+    try:
+        yield from articles
+    except JSON_ERRORS as e:
+        errors.append(e)
 
-def generate_article_markdown(article: Dict[str, Any], out_dir: str = "md_export") -> str:
+def generate_article_markdown(article: Dict[str, Any], out_dir: str = "md_export", md_dir: str = None, log=print) -> str:
     """
     Generate Markdown content for a single article
+    Local image links are relative to md_dir, the directory the Markdown file
+    is written to (default out_dir); image download messages are passed to log
     """
     # Article basic information
     title = article.get('title', 'Untitled')
@@ -695,181 +868,330 @@ def generate_article_markdown(article: Dict[str, Any], out_dir: str = "md_export
         parsed_content = ""
     
     # Handle S3 image downloads by scanning the rendered markdown for S3 URLs
-    # This is robust regardless of rich-text node structure
+    # This is robust regardless of rich-text node structure (image nodes, link
+    # marks and raw text all count); a substring check skips the scan for
+    # content without any S3 reference
     s3_url_mapping = {}
-    if parsed_content:
-        # Unescape HTML entities so &amp; etc. do not break URL matching
-        scannable = html.unescape(parsed_content)
-
-        # Regex to find S3 URLs in markdown or raw text
-        # group(1) is the full URL; group(2) is the tail after domain (key + optional query)
-        s3_url_pattern = re.compile(
-            r'(https?://geolytics-hub-images\.s3\.eu-central-1\.amazonaws\.com/([^\s\)\]"\'<>]+))',
-            re.IGNORECASE
-        )
-
-        # Also match <img src="..."> or <img src='...'>
-        html_img_pattern = re.compile(
-            r'<img[^>]+src=["\'](https?://geolytics-hub-images\.s3\.eu-central-1\.amazonaws\.com/([^\s\)\]"\'<>]+))["\']',
-            re.IGNORECASE
-        )
-
-        matches = []
-        matches.extend(s3_url_pattern.finditer(scannable))
-        matches.extend(html_img_pattern.finditer(scannable))
+    if parsed_content and S3_IMAGE_HOST in parsed_content.lower():
+        # Unescape HTML entities so &amp; etc. do not break URL matching;
+        # without an '&' there is nothing to unescape
+        scannable = html.unescape(parsed_content) if '&' in parsed_content else parsed_content
+
+        matches = list(_S3_URL_RE.finditer(scannable))
         if matches:
-            print(f"Found {len(matches)} S3 image URL(s) in markdown for article: {title[:50]}...")
+            log(f"Found {len(matches)} S3 image URL(s) in markdown for article: {title[:50]}...")
+            # Missing images by key -> (local path, URLs referring to it), so each
+            # key is downloaded once even if several URLs (e.g. query strings) share it
+            pending = {}
+            pending_urls = set()
             for m in matches:
                 original_url = m.group(1)
                 full_tail = m.group(2)  # key plus optional query
                 # Strip query params from key
                 key = full_tail.split('?', 1)[0]
-                if original_url in s3_url_mapping:
+                if original_url in s3_url_mapping or original_url in pending_urls:
                     continue
                 # Compute expected local target; if exists, reuse without re-downloading
-                abs_path, rel_path = compute_local_image_paths(key, out_dir)
+                abs_path, rel_path = compute_local_image_paths(key, out_dir, md_dir)
                 if os.path.exists(abs_path):
                     s3_url_mapping[original_url] = rel_path
-                    print(f"  Exists locally, reuse: {rel_path}")
+                    log(f"  Exists locally, reuse: {rel_path}")
                     continue
-                print(f"  Downloading: {key}")
-                image_data = download_s3_image_via_lambda(key)
-                if image_data:
-                    saved_rel = save_image_locally(image_data, key, out_dir)
-                    # Use ./ prefix to ensure previewers resolve relative path from the md file
-                    rel_final = saved_rel if saved_rel.startswith(('./', '/')) else f"./{saved_rel}"
-                    s3_url_mapping[original_url] = rel_final
-                    print(f"    Saved to: {saved_rel}")
-                else:
-                    # Keep original URL on failure
-                    s3_url_mapping[original_url] = original_url
-                    print(f"    Failed to download, keeping original URL")
+                pending.setdefault(key, (rel_path, []))[1].append(original_url)
+                pending_urls.add(original_url)
+            
+            if pending:
+                # Downloads are network-bound, so fetch them concurrently; a key
+                # already being fetched for another article shares that download
+                with ThreadPoolExecutor(max_workers=min(len(pending), MAX_IMAGE_DOWNLOADS)) as pool:
+                    downloads = {}
+                    with _IMAGE_DOWNLOADS_LOCK:
+                        for key in pending:
+                            if key in _IMAGE_DOWNLOADS:
+                                log(f"  Already downloading: {key}")
+                            else:
+                                log(f"  Downloading: {key}")
+                                _IMAGE_DOWNLOADS[key] = pool.submit(download_and_save_image, key, out_dir)
+                            downloads[key] = _IMAGE_DOWNLOADS[key]
+                    
+                    for key, (rel_path, urls) in pending.items():
+                        if downloads[key].result():
+                            for original_url in urls:
+                                s3_url_mapping[original_url] = rel_path
+                            log(f"    Saved to: {rel_path}")
+                        else:
+                            # Keep original URL on failure
+                            for original_url in urls:
+                                s3_url_mapping[original_url] = original_url
+                            log(f"    Failed to download {key}, keeping original URL")
 
         # Replace S3 URLs in parsed content with local paths
         if s3_url_mapping:
-            for original_url, local_path in s3_url_mapping.items():
-                parsed_content = parsed_content.replace(original_url, local_path)
+            # Single pass over the content; longest URLs first so a URL that is a
+            # prefix of another (e.g. without its query string) can't match early
+            url_pattern = re.compile('|'.join(
+                re.escape(url) for url in sorted(s3_url_mapping, key=len, reverse=True)
+            ))
+            parsed_content = url_pattern.sub(lambda m: s3_url_mapping[m.group(0)], parsed_content)
             
-            # Convert any markdown links to images when they point to image files,
-            # but avoid already-image syntax using negative lookbehind for '!'
-            # e.g., [alt](./images/foo.png) => ![](./images/foo.png)
-            link_to_image_pattern = re.compile(
-                r"(?<!!)\[[^\]]*\]\(((?:\.\/?images\/)[^)]+\.(?:png|jpg|jpeg|gif|webp|svg))\)",
-                re.IGNORECASE,
-            )
-            parsed_content = link_to_image_pattern.sub(r"![](\1)", parsed_content)
-    
-    # Generate Markdown content
-    md_content = []
-    md_content.append(f"# {title}")
-    md_content.append("")
+            # Convert any markdown links to images when they point to image files
+            parsed_content = _LINK_TO_IMG_RE.sub(r"![](\1)", parsed_content)
+    
+    # Generate Markdown content; fixed runs of lines are added in one call
+    md_content = [f"# {title}", "", "## Basic Information"]
+    add = md_content.append
+    extend = md_content.extend
     
     # Basic information
-    md_content.append("## Basic Information")
     if article_id:
-        md_content.append(f"- **ID**: {article_id}")
-    md_content.append(f"- **Author**: {format_authors(authors)}")
-    md_content.append(f"- **Last Edited**: {format_date(last_edited)}")
-    md_content.append("")
+        add(f"- **ID**: {article_id}")
+    extend((
+        f"- **Author**: {format_authors(tuple(authors or ()))}",
+        f"- **Last Edited**: {format_date(last_edited)}",
+        "",
+    ))
     
     # Categories and tags
     if channels:
-        md_content.append("## Categories")
-        md_content.append(f"- **Channels**: {', '.join(channels)}")
+        extend(("## Categories", f"- **Channels**: {', '.join(channels)}"))
     
     if tags:
-        md_content.append(f"- **Tags**: {format_tags(tags)}")
+        add(f"- **Tags**: {format_tags(tags)}")
     
     if countries:
-        md_content.append(f"- **Countries**: {format_countries(countries)}")
+        add(f"- **Countries**: {format_countries(countries)}")
     
-    md_content.append("")
+    add("")
     
     # Key takeaways
     if key_takeaways:
-        md_content.append("## Key Takeaways")
-        md_content.append(clean_text(key_takeaways))
-        md_content.append("")
+        extend(("## Key Takeaways", clean_text(key_takeaways), ""))
     
     # Article content
     if parsed_content.strip():
-        md_content.append("## Article Content")
-        md_content.append(parsed_content)
-        md_content.append("")
+        extend(("## Article Content", parsed_content, ""))
     
     return "\n".join(md_content)
 
-def get_existing_article_ids(out_dir="md_export"):
-    """
-    Get list of existing article IDs from the output directory
-    Now that filenames are date-based, we need to read file contents to get IDs
-    """
-    existing_ids = set()
+def get_existing_article_paths(out_dir="md_export", known_ids=None):
+    """
+    Map existing article IDs to their file paths in the output directory
+    Filenames are date-based, so IDs are read from file contents unless the
+    filename is in known_ids (filename relative to out_dir -> ID, from the
+    article index); callers should build this once per run and reuse it
+    Month subdirectories written with --shard-by-month (YYYY-MM or unknown) are
+    scanned too; other folders, e.g. user archives, are ignored
+    """
+    if known_ids is None:
+        known_ids = {}
+    existing_paths = {}
     if not os.path.exists(out_dir):
-        return existing_ids
-    
-    for filename in os.listdir(out_dir):
-        if filename.endswith('.md'):
-            file_path = os.path.join(out_dir, filename)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Look for ID line in the file
-                    for line in content.split('\n'):
-                        if line.startswith('- **ID**: '):
-                            article_id = line.replace('- **ID**: ', '').strip()
-                            existing_ids.add(article_id)
-                            break
-            except:
-                continue
-    
-    return existing_ids
-
-def get_existing_article_content(out_dir="md_export", article_id=""):
+        return existing_paths
+    
+    # scandir entries carry cached file type info, saving a stat per file
+    unindexed_paths = []
+    dirs = [(out_dir, "")]
+    while dirs:
+        dir_path, prefix = dirs.pop()
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if not prefix and _MONTH_DIR_RE.fullmatch(entry.name) and entry.is_dir():
+                    dirs.append((entry.path, f"{entry.name}/"))
+                    continue
+                if entry.name.endswith('.md') and entry.is_file():
+                    filename = prefix + entry.name
+                    if filename in known_ids:
+                        existing_paths[known_ids[filename]] = entry.path
+                    else:
+                        unindexed_paths.append(entry.path)
+    
+    # Files outside the index are read after the scan, so a stale copy (e.g. the
+    # old file of a renamed article) never replaces the path the index gave
+    for path in unindexed_paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                # Look for ID line in the file
+                for line in f:
+                    if line.startswith('- **ID**: '):
+                        article_id = line.replace('- **ID**: ', '').strip()
+                        if article_id not in existing_paths:
+                            existing_paths[article_id] = path
+                        break
+        except (OSError, ValueError):
+            continue
+    
+    return existing_paths
+
+def get_existing_article_content(out_dir="md_export", article_id="", existing_paths=None):
     """
     Get existing article content for comparison
-    Now that filenames are date-based, we need to read file contents to find by ID
+    Pass existing_paths (from get_existing_article_paths) to avoid rescanning out_dir
     """
     if not article_id:
         return None
     
-    # Find the file with this ID by reading file contents
-    if not os.path.exists(out_dir):
+    if existing_paths is None:
+        existing_paths = get_existing_article_paths(out_dir)
+    
+    file_path = existing_paths.get(article_id)
+    if not file_path:
         return None
     
-    for filename in os.listdir(out_dir):
-        if filename.endswith('.md'):
-            file_path = os.path.join(out_dir, filename)
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Look for ID line in the file
-                    for line in content.split('\n'):
-                        if line.startswith('- **ID**: '):
-                            file_article_id = line.replace('- **ID**: ', '').strip()
-                            if file_article_id == article_id:
-                                return content
-                            break
-            except:
-                continue
-    
-    return None
-
-def convert_json_to_markdown(input_path="raw.json", out_dir="md_export"):
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except (OSError, ValueError):
+        return None
+
+def hash_article_markdown(article_md: str) -> str:
+    """
+    Hash rendered article Markdown for change detection
+    """
+    return hashlib.blake2b(article_md.encode('utf-8'), digest_size=16).hexdigest()
+
+def hash_article_source(article: Dict[str, Any]) -> str:
+    """
+    Hash an article's API payload, so unchanged articles can skip rendering
+    """
+    digest = hashlib.blake2b(json_dumps_bytes(article), digest_size=16)
+    digest.update(str(RENDER_VERSION).encode('ascii'))
+    return digest.hexdigest()
+
+def is_index_entry_current(entry, source_hash: str, out_dir="md_export") -> bool:
+    """
+    Whether an article can skip rendering: its payload matches the indexed
+    source hash and every local image its Markdown references still exists
+    Entries without an image list predate it and are re-rendered once
+    """
+    if entry.get('source') != source_hash or 'images' not in entry:
+        return False
+    return all(os.path.exists(os.path.join(out_dir, path)) for path in entry['images'])
+
+def load_article_index(out_dir="md_export"):
+    """
+    Load the article ID -> {"filename", "source", "markdown", "images"} index, empty if
+    missing or unreadable; malformed entries are dropped
+    """
+    try:
+        with open(os.path.join(out_dir, INDEX_FILENAME), 'rb') as f:
+            index = json_loads(f.read())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(index, dict):
+        return {}
+    return {article_id: entry for article_id, entry in index.items() if isinstance(entry, dict)}
+
+def save_article_index(index, out_dir="md_export"):
+    """
+    Save the article ID -> {"filename", "source", "markdown", "images"} index
+    """
+    write_bytes_atomic(os.path.join(out_dir, INDEX_FILENAME), json_dumps_bytes(index, indent=True))
+
+def write_text_file(path, text: str):
+    """
+    Write a UTF-8 text file; a buffer larger than the text flushes it in one
+    write() call
+    """
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(text)
+
+def write_log_entry(log_path, total_articles, new_log_lines, updated_log_lines):
+    """
+    Prepend a log entry listing new and updated articles to the log file
+    """
+    # Read existing log file to preserve history
+    existing_log = ""
+    if os.path.exists(log_path):
+        with open(log_path, 'r', encoding='utf-8') as f:
+            existing_log = f.read()
+    
+    current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    log_buf = io.StringIO()
+    log_buf.write(
+        f"## Log Entry - {current_time}\n"
+        f"> Total articles: {total_articles}\n"
+        f"> New articles: {len(new_log_lines)}\n"
+        f"> Updated articles: {len(updated_log_lines)}\n"
+        "\n"
+    )
+    
+    if new_log_lines:
+        log_buf.write("## New Articles\n")
+        log_buf.write("".join(new_log_lines))
+        log_buf.write("\n")
+    
+    if updated_log_lines:
+        log_buf.write("## Updated Articles\n")
+        log_buf.write("".join(updated_log_lines))
+        log_buf.write("\n")
+    
+    # Save updated log file via a temp file, so a failed write can't truncate
+    # the history; the existing content follows the new entry as a second
+    # write rather than being copied into the buffer
+    tmp_path = f"{log_path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(log_buf.getvalue())
+        f.write(existing_log)
+    os.replace(tmp_path, log_path)
+
+def article_subdir(article: Dict[str, Any]) -> str:
+    """
+    Month subdirectory (YYYY-MM) of an article's file with --shard-by-month
+    """
+    return format_date_for_filename(article.get('last_edited_date', ''))[:7]
+
+def render_articles_ahead(articles, stored_index, out_dir="md_export", shard_by_month=False):
+    """
+    Yield (article, source_hash, article_md) in payload order, rendering up to
+    MAX_ARTICLE_WORKERS articles ahead in worker threads
+    article_md is None when the source hash matches the article index; each
+    article's image messages are printed as a block when it is yielded
+    """
+    def finish(item):
+        article, source_hash, future, messages = item
+        article_md = future.result() if future else None
+        for message in messages:
+            print(message)
+        return article, source_hash, article_md
+    
+    with ThreadPoolExecutor(max_workers=MAX_ARTICLE_WORKERS) as pool:
+        window = deque()
+        for article in articles:
+            source_hash = hash_article_source(article)
+            future = None
+            messages = []
+            if not is_index_entry_current(stored_index.get(article.get('id', ''), {}), source_hash, out_dir):
+                md_dir = os.path.join(out_dir, article_subdir(article)) if shard_by_month else out_dir
+                future = pool.submit(generate_article_markdown, article, out_dir, md_dir, messages.append)
+            window.append((article, source_hash, future, messages))
+            if len(window) > MAX_ARTICLE_WORKERS:
+                yield finish(window.popleft())
+        while window:
+            yield finish(window.popleft())
+
+def convert_json_to_markdown(input_path="raw.json", out_dir="md_export", verbose=False, shard_by_month=False):
     """
     Convert JSON data to Markdown files
+    Per-article progress lines are only printed when verbose is set; with
+    shard_by_month, files are written to YYYY-MM subdirectories of out_dir
     """
     try:
-        # Read JSON file
+        # Read JSON file; articles are streamed and processed in a single pass
         print(f"Reading {input_path} file...")
-        data = load_payload(input_path)
-        articles = data.get('topics', [])
+        # A malformed payload ends the pass early (e.g. ijson only finds a
+        # truncated body midway); articles before it are still saved and logged
+        parse_errors = []
+        articles = stop_at_parse_error(iter_articles(input_path), parse_errors)
         
-        print(f"Found {len(articles)} articles")
-        
-        # Get existing article IDs to detect new ones
-        existing_ids = get_existing_article_ids(out_dir)
-        print(f"Found {len(existing_ids)} existing articles in {out_dir}")
+        # Scan existing articles once to detect new ones and compare content;
+        # files recorded in the article index don't need to be opened
+        stored_index = load_article_index(out_dir)
+        known_ids = {entry['filename']: article_id for article_id, entry in stored_index.items() if entry.get('filename')}
+        existing_paths = get_existing_article_paths(out_dir, known_ids)
+        print(f"Found {len(existing_paths)} existing articles in {out_dir}")
+        article_index = {}
+        # Filename -> ID of the article that last wrote it in this run
+        written_by = {}
         
         # Create output directory (only if it doesn't exist)
         if not os.path.exists(out_dir):
@@ -880,160 +1202,163 @@ def convert_json_to_markdown(input_path="raw.json", out_dir="md_export"):
         updated_articles_count = 0
         unchanged_articles_count = 0
         
-        # Process each article
-        for i, article in enumerate(articles, 1):
-            article_id = article.get('id', '')
-            safe_id = (article_id or "")[:8]
+        # Log lines and statistics are built during the single pass
+        new_log_lines = []
+        updated_log_lines = []
+        total_articles = 0
+        unique_tags, unique_countries, unique_authors = set(), set(), set()
+        
+        # out_dir is fixed for the run, so paths below are built by concatenation
+        out_dir_prefix = os.path.join(out_dir, "")
+        
+        # Article files are written in background threads; filename -> future of
+        # its latest write, so writes to (and reads of) the same file stay ordered
+        writer = ThreadPoolExecutor(max_workers=MAX_FILE_WRITERS)
+        write_futures = {}
+        
+        # Process each article; rendering runs slightly ahead in worker threads,
+        # while comparing and writing files stays in payload order
+        for i, (article, source_hash, rendered_md) in enumerate(render_articles_ahead(articles, stored_index, out_dir, shard_by_month), 1):
+            total_articles = i
+            # Fields used throughout the loop, read once
+            article_id = article.get('id') or ''
+            title = article.get('title', f'Article {i}')
             last_edited = article.get('last_edited_date', '')
+            authors = article.get('authors') or ()
             
             # Check if this is a new article
-            is_new = article_id not in existing_ids if article_id else True
+            is_new = not article_id or article_id not in existing_paths
             
             # Generate filename using edit date instead of ID
-            title = article.get('title', f'Article {i}')
             slug = slugify(title) or f"article-{i}"
             date_prefix = format_date_for_filename(last_edited)
             filename = f"{date_prefix}-{slug}.md"
+            md_dir = out_dir
+            if shard_by_month:
+                subdir = article_subdir(article)
+                filename = f"{subdir}/{filename}"
+                md_dir = out_dir_prefix + subdir
             
-            # Generate article Markdown
-            article_md = generate_article_markdown(article, out_dir)
+            # Index entries from the previous run can only be trusted while the
+            # existing file has not been overwritten by another article in this run
+            stored = {}
+            existing_filename = None
+            if not is_new:
+                existing_filename = os.path.relpath(existing_paths[article_id], out_dir).replace('\\', '/')
+                if existing_filename not in written_by:
+                    stored = stored_index.get(article_id, {})
             
-            # Check if content has changed for existing articles
             content_changed = True
-            if not is_new:
-                existing_content = get_existing_article_content(out_dir, article_id)
-                if existing_content == article_md:
-                    content_changed = False
-                    unchanged_articles_count += 1
-                    print(f"Processing existing article {i} (ID: {safe_id}) - No changes")
-                else:
-                    updated_articles_count += 1
-                    print(f"Processing existing article {i} (ID: {safe_id}) - Updated")
+            if is_index_entry_current(stored, source_hash, out_dir):
+                # Same payload as the last render; skip parsing and rendering
+                article_index[article_id] = {**stored, 'filename': existing_filename}
+                content_changed = False
+                unchanged_articles_count += 1
+                if verbose:
+                    print(f"Processing existing article {i} (ID: {article_id[:8]}) - No changes")
             else:
-                new_articles_count += 1
-                print(f"Processing NEW article {i} (ID: {safe_id})...")
+                # Use the article Markdown rendered ahead, if any
+                article_md = rendered_md if rendered_md is not None else generate_article_markdown(article, out_dir, md_dir)
+                article_hash = hash_article_markdown(article_md)
+                if article_id:
+                    article_index[article_id] = {
+                        'filename': existing_filename,
+                        # Leave out the source hash while images are still remote
+                        # (e.g. a failed download) so the next run retries them
+                        'source': source_hash if S3_IMAGE_HOST not in article_md else None,
+                        'markdown': article_hash,
+                        # Checked before skipping, so deleted images are fetched again
+                        'images': sorted(set(_LOCAL_IMAGE_RE.findall(article_md))),
+                    }
+                
+                # Check if content has changed for existing articles; compare hashes,
+                # falling back to the file itself for articles not in the manifest
+                if not is_new:
+                    if stored.get('markdown'):
+                        unchanged = stored['markdown'] == article_hash
+                    else:
+                        if existing_filename in write_futures:
+                            write_futures[existing_filename].result()
+                        unchanged = get_existing_article_content(out_dir, article_id, existing_paths) == article_md
+                    if unchanged:
+                        content_changed = False
+                        unchanged_articles_count += 1
+                        if verbose:
+                            print(f"Processing existing article {i} (ID: {article_id[:8]}) - No changes")
+                    else:
+                        updated_articles_count += 1
+                        if verbose:
+                            print(f"Processing existing article {i} (ID: {article_id[:8]}) - Updated")
+                else:
+                    new_articles_count += 1
+                    if verbose:
+                        print(f"Processing NEW article {i} (ID: {article_id[:8]})...")
+                
+                # Save article file (only if new or content changed)
+                if is_new or content_changed:
+                    article_path = out_dir_prefix + filename
+                    if shard_by_month:
+                        ensure_dir(md_dir)
+                    if filename in write_futures:
+                        write_futures[filename].result()
+                    write_futures[filename] = writer.submit(write_text_file, article_path, article_md)
+                    written_by[filename] = article_id
+                    if article_id:
+                        article_index[article_id]['filename'] = filename
             
-            # Save article file (only if new or content changed)
+            # Add to log
             if is_new or content_changed:
-                article_path = os.path.join(out_dir, filename)
-                with open(article_path, 'w', encoding='utf-8') as f:
-                    f.write(article_md)
-        
-        # Read existing log file to preserve history
-        log_path = "log.md"
-        existing_log_lines = []
-        if os.path.exists(log_path):
-            with open(log_path, 'r', encoding='utf-8') as f:
-                existing_log_lines = f.readlines()
-        
-        # Generate new log entry
-        current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        new_log_entry = [
-            f"## Log Entry - {current_time}\n",
-            f"> Total articles: {len(articles)}\n",
-            f"> New articles: {new_articles_count}\n",
-            f"> Updated articles: {updated_articles_count}\n",
-            "\n"
-        ]
-        
-        # Generate log entry with only new and updated articles
-        all_lines = []
-        all_lines.extend(new_log_entry)
-        
-        if new_articles_count > 0 or updated_articles_count > 0:
-            if new_articles_count > 0:
-                all_lines.append("## New Articles\n")
-                for i, article in enumerate(articles, 1):
-                    article_id = article.get('id', '')
-                    safe_id = (article_id or "")[:8]
-                    last_edited = article.get('last_edited_date', '')
-                    is_new = article_id not in existing_ids if article_id else True
-                    
-                    if is_new:
-                        # Generate filename using edit date instead of ID
-                        title = article.get('title', f'Article {i}')
-                        slug = slugify(title) or f"article-{i}"
-                        date_prefix = format_date_for_filename(last_edited)
-                        filename = f"{date_prefix}-{slug}.md"
-                        
-                        # Add to log
-                        authors = article.get('authors', [])
-                        author_line = ", ".join(authors) if authors else "Unknown author"
-                        all_lines.append(f"- [{title}]({filename}) — {author_line} ({format_date(last_edited)}) 🆕\n")
-                
-                all_lines.append("\n")
+                author_line = ", ".join(authors) if authors else "Unknown author"
+                status_marker = "🆕" if is_new else "🔄"
+                log_line = f"- [{title}]({filename}) — {author_line} ({format_date(last_edited)}) {status_marker}\n"
+                if is_new:
+                    new_log_lines.append(log_line)
+                else:
+                    updated_log_lines.append(log_line)
             
-            if updated_articles_count > 0:
-                all_lines.append("## Updated Articles\n")
-                for i, article in enumerate(articles, 1):
-                    article_id = article.get('id', '')
-                    safe_id = (article_id or "")[:8]
-                    last_edited = article.get('last_edited_date', '')
-                    is_new = article_id not in existing_ids if article_id else True
-                    
-                    if not is_new:
-                        # Check if content changed
-                        existing_content = get_existing_article_content(out_dir, article_id)
-                        article_md = generate_article_markdown(article, out_dir)
-                        content_changed = existing_content != article_md
-                        
-                        if content_changed:
-                            # Generate filename using edit date instead of ID
-                            title = article.get('title', f'Article {i}')
-                            slug = slugify(title) or f"article-{i}"
-                            date_prefix = format_date_for_filename(last_edited)
-                            filename = f"{date_prefix}-{slug}.md"
-                            
-                            # Add to log
-                            authors = article.get('authors', [])
-                            author_line = ", ".join(authors) if authors else "Unknown author"
-                            all_lines.append(f"- [{title}]({filename}) — {author_line} ({format_date(last_edited)}) 🔄\n")
-                
-                all_lines.append("\n")
+            unique_authors.update(authors)
+            unique_tags.update(article.get('tags') or ())
+            unique_countries.update(article.get('countries') or ())
         
-        # Add existing log content
-        if existing_log_lines:
-            all_lines.extend(existing_log_lines)
+        # Wait for all article files, raising any write error
+        writer.shutdown(wait=True)
+        for future in write_futures.values():
+            future.result()
         
-        # Save updated log file
-        with open(log_path, 'w', encoding='utf-8') as f:
-            f.writelines(all_lines)
+        # Keep entries of articles not in this payload so they remain comparable,
+        # but drop any whose file was overwritten by another article
+        save_article_index({
+            article_id: entry
+            for article_id, entry in {**stored_index, **article_index}.items()
+            if written_by.get(entry.get('filename'), article_id) == article_id
+        }, out_dir)
         
+        # Only touch the log when something was added or updated
+        log_path = "log.md"
+        if new_articles_count > 0 or updated_articles_count > 0:
+            write_log_entry(log_path, total_articles, new_log_lines, updated_log_lines)
         
         print(f"✅ Successfully processed {out_dir} directory")
-        print(f"📊 Processed {len(articles)} articles")
+        print(f"📊 Processed {total_articles} articles")
         print(f"🆕 New articles: {new_articles_count}")
         print(f"🔄 Updated articles: {updated_articles_count}")
         print(f"✅ Unchanged articles: {unchanged_articles_count}")
         
         # Display statistics
         print("\n📈 Statistics:")
-        print(f"- Total articles: {len(articles)}")
+        print(f"- Total articles: {total_articles}")
         print(f"- New articles downloaded: {new_articles_count}")
         print(f"- Existing articles updated: {updated_articles_count}")
         print(f"- Unchanged articles: {unchanged_articles_count}")
         
-        # Count tags
-        all_tags = []
-        for article in articles:
-            all_tags.extend(article.get('tags', []))
-        unique_tags = list(set(all_tags))
         print(f"- Unique tags: {len(unique_tags)}")
-        
-        # Count countries
-        all_countries = []
-        for article in articles:
-            all_countries.extend(article.get('countries', []))
-        unique_countries = list(set(all_countries))
         print(f"- Countries involved: {len(unique_countries)}")
-        
-        # Count authors
-        all_authors = []
-        for article in articles:
-            all_authors.extend(article.get('authors', []))
-        unique_authors = list(set(all_authors))
         print(f"- Unique authors: {len(unique_authors)}")
         
+        if parse_errors:
+            print(f"❌ Error: JSON parsing failed after {total_articles} articles - {parse_errors[0]}")
+            return False, new_articles_count
+        
         return True, new_articles_count
         
     except FileNotFoundError:
@@ -1058,24 +1383,21 @@ def main():
     parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help=f"Articles per batch (default: {DEFAULT_BATCH_SIZE})")
     parser.add_argument("--num-batches", type=int, default=DEFAULT_NUM_BATCHES, help=f"Number of batches to download (default: {DEFAULT_NUM_BATCHES})")
     parser.add_argument("--skip-download", action="store_true", help="Skip download and use existing raw.json file")
+    parser.add_argument("--verbose", action="store_true", help="Print a progress line for every article")
+    parser.add_argument("--shard-by-month", action="store_true", help="Write articles to YYYY-MM subdirectories of the output directory")
     args = parser.parse_args()
     
     # Download data if not skipping
     if not args.skip_download:
         print("🔄 Step 1: Downloading data from API...")
-        if args.num_batches > 1:
-            if not download_multiple_batches(args.input, args.batch_size, args.num_batches):
-                print("❌ Failed to download data. Exiting.")
-                return
-        else:
-            if not download_raw_data(args.input, args.batch_size, 0):
-                print("❌ Failed to download data. Exiting.")
-                return
+        if not download_multiple_batches(args.input, args.batch_size, max(args.num_batches, 1)):
+            print("❌ Failed to download data. Exiting.")
+            return
         print()
     
     # Convert to Markdown
     print("🔄 Step 2: Converting to Markdown...")
-    success, new_count = convert_json_to_markdown(args.input, args.out)
+    success, new_count = convert_json_to_markdown(args.input, args.out, args.verbose, args.shard_by_month)
     
     if success:
         print(f"\n✅ All done! Downloaded {new_count} new articles.")